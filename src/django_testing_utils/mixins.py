@@ -1,17 +1,31 @@
+import io
+import pickle
 from copy import deepcopy
-from datetime import timedelta, datetime, tzinfo
+from datetime import timedelta, datetime, tzinfo, date, time, \
+    timezone as dt_timezone
+from decimal import Decimal
 from functools import wraps
 from typing import TypeVar, Union, Tuple, Any, TYPE_CHECKING, Dict, cast, Type, \
-    Optional
+    Optional, Set, List
 from unittest import mock
+from uuid import UUID
 
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models.base import ModelState
+from django.db.models.fields.files import FieldFile
 from django.test import TestCase
 from django.utils import timezone
 
+from django_testing_utils.utils import Patch
+
 SET_UP_TEST_DATA = 'setUpTestData'
 CREATED_OBJECTS = '_created_objects'
+CREATED_INDEX = '_created_index'
+DIRTY_OBJECTS = '_dirty_objects'
 RECORDS_OBJECTS = '_records_objects'
+RECORDING = '_recording'
 
 second = timedelta(seconds=1)
 minute = timedelta(minutes=1)
@@ -20,6 +34,16 @@ day = timedelta(days=1)
 
 M = TypeVar('M', bound=models.Model)
 
+# immutable value types that are safe to share between model instance copies
+ATOMIC_TYPES = frozenset((int, float, bool, str, bytes, type(None), Decimal,
+                          UUID, datetime, date, time, timedelta))
+# persistent id for saved instance references in pickled snapshots
+INSTANCE_ID = 'instance'
+# model instance attributes that are not saved to snapshots
+SKIPPED_ATTRIBUTES = frozenset(('_state', '_prefetched_objects_cache'))
+# builtin container types that are stored pickled between tests
+CONTAINER_TYPES = frozenset((list, dict, set, frozenset, tuple))
+
 # type definition for TestCase subclass mixed with TimeMixin
 TimeDerived = Union["TimeMixin", TestCase]
 
@@ -30,11 +54,24 @@ class MockedDateTime(datetime):
 
     Helps to override model_utils.TimeStampedModel.created.default
     """
+    # frozen time in UTC, set by TimeMixin
+    _frozen_utc: datetime
 
     @classmethod
     def utcnow(cls):  # type: ignore
-        # noinspection PyUnresolvedReferences
-        return timezone.utc.normalize(timezone.now())
+        return cls._frozen_utc
+
+    @classmethod
+    def now(cls, tz: Optional[tzinfo] = None):  # type: ignore
+        # timezone.datetime.now() is in closure for timezone.now(), and to
+        # make it work with now() method imported to another modules it
+        # returns frozen time also.
+        return cls._frozen_utc.astimezone(tz)
+
+
+def _real_now() -> datetime:
+    """ Returns current time same as not patched `timezone.now()` does."""
+    return datetime.now(tz=dt_timezone.utc if settings.USE_TZ else None)
 
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -45,61 +82,303 @@ else:
 
 class TimeMixin(TimeMixinTarget):
     """ Mixin to freeze time in django tests."""
-    now: datetime
+    _now: datetime
+    now_mock: mock.MagicMock
+    now_patcher: Patch
+    timezone_datetime_patcher: Patch
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Patchers are started once per test case after setUpTestData, and
+        # frozen time is reset in each test.
+        now = _real_now()
 
-    def setUp(self) -> None:
-        super().setUp()
-        self.now = timezone.now()
         # timezone.now() is recommended way to access current datetime.
-        self.now_patcher = mock.patch('django.utils.timezone.now',
-                                      side_effect=self.get_now)
-        self.now_patcher.start()
+        cls.now_mock = mock.MagicMock(return_value=now)
+        cls.now_patcher = mock.patch('django.utils.timezone.now',
+                                     cls.now_mock)
 
         # datetime is an imported C-extension, so it must be replaces
-        # completely.
-        self.timezone_datetime_patcher = mock.patch(
-            'django.utils.timezone.datetime',
-            new_callable=mock.PropertyMock(return_value=MockedDateTime))
-        self.timezone_datetime_patcher.start()
-        # timezone.datetime.now() is in closure for timezone.now(), and to
-        # make it work with now() method imported to another modules we need
-        # to mock MockedDateTime.now also.
-        self.timezone_datetime_now_patcher = mock.patch(
-            'django.utils.timezone.datetime.now',
-            side_effect=self.get_now)
-        self.timezone_datetime_now_patcher.start()
-
-    def tearDown(self) -> None:
-        super().tearDown()
-        self.timezone_datetime_now_patcher.stop()
-        self.timezone_datetime_patcher.stop()
-        self.now_patcher.stop()
+        # completely. MockedDateTime.now() returns frozen time without
+        # additional patching.
+        MockedDateTime._frozen_utc = now.astimezone(dt_timezone.utc)
+        cls.timezone_datetime_patcher = mock.patch(
+            'django.utils.timezone.datetime', MockedDateTime)
+        cls.start_time_patchers()
+        # class cleanups are called even if setUpClass of a subclass fails
+        # NOBUG addClassCleanup is not available in Python 3.7
+        if hasattr(cls, 'addClassCleanup'):
+            cls.addClassCleanup(cls.stop_time_patchers)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        try:
+            super().tearDownClass()
+        finally:
+            cls.stop_time_patchers()
+
+    @classmethod
+    def start_time_patchers(cls) -> None:
+        """ Starts time patchers that are not active."""
+        if timezone.now is not cls.now_mock:
+            cls.now_patcher.start()
+        # NOBUG datetime is imported to django.utils.timezone, but mypy
+        # complains that it is not exported
+        if timezone.datetime is not MockedDateTime:  # type: ignore[attr-defined]
+            cls.timezone_datetime_patcher.start()
+
+    @classmethod
+    def stop_time_patchers(cls) -> None:
+        """ Stops time patchers that are active."""
+        # Python 3.7 raises RuntimeError when stopping a stopped patcher
+        # NOBUG datetime is imported to django.utils.timezone, but mypy
+        # complains that it is not exported
+        if timezone.datetime is MockedDateTime:  # type: ignore[attr-defined]
+            cls.timezone_datetime_patcher.stop()
+        if timezone.now is cls.now_mock:
+            cls.now_patcher.stop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        # restart patchers if previous test stopped them
+        self.start_time_patchers()
+        # mock is shared by test case, so side_effect set by a previous test
+        # is also removed.
+        self.now_mock.reset_mock(return_value=True, side_effect=True)
+        # also sets timezone.now() and MockedDateTime frozen time
+        self.now = _real_now()
+
+    @property
+    def now(self) -> datetime:
+        """ Frozen current time."""
+        return self._now
+
+    @now.setter
+    def now(self, value: datetime) -> None:
+        self._now = value
+        self.now_mock.return_value = value
+        MockedDateTime._frozen_utc = value.astimezone(dt_timezone.utc)
 
     def get_now(self, tz: Optional[tzinfo] = None) -> datetime:
+        # Not used by patchers anymore, kept for backwards compatibility only.
         return self.now.astimezone(tz)
 
 
+class _InstancePickler(pickle.Pickler):
+    """ Pickler that saves references to an instance by id."""
+
+    def __init__(self, file: io.BytesIO, obj: models.Model) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.obj = obj
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self.obj:
+            return INSTANCE_ID
+        return None
+
+
+class _InstanceUnpickler(pickle.Unpickler):
+    """ Unpickler that replaces saved instance references with an object."""
+
+    def __init__(self, file: io.BytesIO, obj: models.Model) -> None:
+        super().__init__(file)
+        self.obj = obj
+
+    def persistent_load(self, pid: Any) -> models.Model:
+        if pid != INSTANCE_ID:
+            raise pickle.UnpicklingError(f'unsupported persistent id {pid!r}')
+        return self.obj
+
+
+class _Snapshot:
+    """
+    Saved state of a django model instance.
+
+    Concrete field values, other instance attributes (i.e. annotations) and
+    database state are stored, so restoring an instance does not copy the
+    whole graph of related objects. Related objects and prefetched objects
+    caches of a restored instance are empty.
+
+    Immutable values are kept as is, mutable ones are pickled once,
+    because unpickling is faster than deep copying them for each test.
+    References to saved instance from mutable values (i.e. helpers like
+    `FieldTracker`) point to restored instance.
+    """
+    __slots__ = ('cls', 'fields', 'extra', 'mutable', 'source', 'state')
+
+    def __init__(self, obj: models.Model) -> None:
+        self.cls = obj.__class__
+        d = obj.__dict__
+        fields = []
+        mutable = {}
+        for f in obj._meta.concrete_fields:
+            v = d.get(f.attname, models.DEFERRED)
+            if isinstance(v, FieldFile):
+                # FileDescriptor creates a new FieldFile from a file name
+                v = v.name
+            if v is not models.DEFERRED and type(v) not in ATOMIC_TYPES:
+                mutable[f.attname] = v
+                # value is restored from mutable fields
+                v = models.DEFERRED
+            fields.append(v)
+        self.fields = tuple(fields)
+        # attributes that are not concrete fields, like annotations
+        attnames = {f.attname for f in obj._meta.concrete_fields}
+        extra = {}
+        for k, v in d.items():
+            if k in attnames or k in SKIPPED_ATTRIBUTES:
+                continue
+            if type(v) in ATOMIC_TYPES:
+                extra[k] = v
+            else:
+                mutable[k] = v
+        self.extra = extra
+        self.mutable: Union[bytes, Dict[str, Any], None] = None
+        # saved instance is kept only for deepcopy memo, so its id is not
+        # reused by another object
+        self.source: Optional[models.Model] = None
+        if mutable:
+            try:
+                buf = io.BytesIO()
+                _InstancePickler(buf, obj).dump(mutable)
+                self.mutable = buf.getvalue()
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # fallback to deepcopy in restore
+                self.mutable = mutable
+                self.source = obj
+        self.state = (obj._state.db, obj._state.adding)
+
+    @property
+    def pk(self) -> Any:
+        """ Primary key value of saved instance."""
+        meta = self.cls._meta
+        return self.fields[meta.concrete_fields.index(meta.pk)]
+
+    def restore(self) -> models.Model:
+        """ Creates a new model instance from saved state."""
+        cls = self.cls
+        obj = cls.__new__(cls)
+        d = {
+            f.attname: v
+            for f, v in zip(cls._meta.concrete_fields, self.fields)
+            if v is not models.DEFERRED
+        }
+        d.update(self.extra)
+        mutable = self.mutable
+        if isinstance(mutable, bytes):
+            d.update(_InstanceUnpickler(io.BytesIO(mutable), obj).load())
+        elif mutable is not None:
+            # references to saved instance are replaced with restored one
+            d.update(deepcopy(mutable, {id(self.source): obj}))
+        state = d['_state'] = ModelState()
+        state.db, state.adding = self.state
+        obj.__dict__ = d
+        return obj
+
+
+class _Pickled:
+    """
+    Pickled class attribute value.
+
+    Template is kept as bytes instead of a live copy of an object graph.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, value: Any) -> None:
+        self.data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def restore(self) -> Any:
+        """ Creates a new copy of pickled value."""
+        return pickle.loads(self.data)
+
+
+def _is_column(obj: models.Model, name: str) -> bool:
+    """
+    Checks whether attribute value is equal to a value fetched with
+    `QuerySet.values()` for same name.
+    """
+    try:
+        field = obj._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return (field.concrete and field.attname == name and
+            not isinstance(field, models.FileField))
+
+
+def _is_plain(value: Any) -> bool:
+    """
+    Checks whether builtin container holds only immutable values, model
+    instances and other such containers.
+
+    Pickling other objects may change them, i.e. pickled queryset is
+    evaluated, while deep copy of a queryset stays lazy.
+    """
+    kind = type(value)
+    if kind in ATOMIC_TYPES or isinstance(value, models.Model):
+        return True
+    if kind not in CONTAINER_TYPES:
+        return False
+    if kind is dict:
+        return all(_is_plain(k) and _is_plain(v) for k, v in value.items())
+    return all(_is_plain(v) for v in value)
+
+
+def _make_template(value: Any) -> Any:
+    """
+    Prepares a class attribute value to be restored between tests.
+
+    Model instances are saved as snapshots, builtin containers of plain
+    values are pickled, other values are deep copied once so that later changes of the original
+    object don't affect the template.
+    """
+    if isinstance(value, models.Model):
+        return _Snapshot(value)
+    if type(value) in ATOMIC_TYPES:
+        return value
+    if _is_plain(value):
+        try:
+            return _Pickled(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # fallback to deepcopy for values that could not be pickled
+            pass
+    return deepcopy(value)
+
+
 def wrap_test_data(set_up_test_data: classmethod) -> classmethod:
     """
     This set_up_test_data backports Django-3.2 strategy of resetting state of objects
     created in setUpTestData class set_up_test_data between tests.
 
-    It computes diff of TestCase class __dict__ before and after set_up_test_data call
-    and creates a deep copy of objects added in setUpTestData.
-    This copy is used to reset class attributes between tests.
+    It enables recording of class attributes set in set_up_test_data call
+    (see `BaseTestCaseMeta.__setattr__`) and saves a snapshot of objects added
+    in setUpTestData. This snapshot is used to reset class attributes between
+    tests.
     """
     func = set_up_test_data.__func__
 
     @wraps(func)
     def wrapper(cls: Type[TestCase]) -> None:
+        if cls.__dict__.get(RECORDING) is not None:
+            # setUpTestData is called via super() from subclass, attributes are
+            # already recorded by outer wrapper.
+            func(cls)
+            return
+        recorded: Dict[str, Any] = {}
+        type.__setattr__(cls, RECORDING, recorded)
+        try:
+            func(cls)
+        finally:
+            type.__setattr__(cls, RECORDING, None)
         cache = getattr(cls, CREATED_OBJECTS)
-        before = cls.__dict__.copy()
-        func(cls)
-        after = cls.__dict__
-        for k, v in after.items():
-            if before.get(k) != v:
-                # attribute <k> was added or changed in setUpTestData, saving
-                cache[k] = v
+        index = getattr(cls, CREATED_INDEX)
+        for k, v in recorded.items():
+            # attribute <k> was added or changed in setUpTestData, saving
+            cache[k] = template = _make_template(v)
+            if isinstance(template, _Snapshot):
+                index.setdefault((template.cls, template.pk), []).append(k)
+        # all recorded attributes must be reset before first test
+        getattr(cls, DIRTY_OBJECTS).update(recorded)
 
     return classmethod(wrapper)
 
@@ -116,14 +395,27 @@ class BaseTestCaseMeta(type):
 
     This metaclass intercepts adding new django model instances as cls members
     and collect it to created_objects list. This list is then used to reset
-    in-memory state from deep copy in `setUp()`.
+    in-memory state from saved snapshot in `setUp()`.
+
+    Related objects cache is not saved, so accessing related object (i.e.
+    `self.task.project`) performs a database query once per test, which is
+    counted by `assertNumQueries`.
     """
     _created_objects: Dict[str, Any]
+    _created_index: Dict[Tuple[Type[models.Model], Any], List[str]]
+    _dirty_objects: Set[str]
+    _recording: Optional[Dict[str, Any]]
 
     def __new__(mcs, name: str, bases: Tuple[type, ...],
                 attrs: Dict[str, Any]) -> 'BaseTestCaseMeta':
         # Add created django model instances cache as class attribute
         attrs[CREATED_OBJECTS] = {}
+        # Created objects cache keys by model and primary key
+        attrs[CREATED_INDEX] = {}
+        # Created objects cache keys replaced since last refresh
+        attrs[DIRTY_OBJECTS] = set()
+        # Attributes set while setUpTestData is running, if any
+        attrs[RECORDING] = None
         setup = attrs.get(SET_UP_TEST_DATA)
         if setup is None:
             # if current class does not define setUpTestData class method, we'll
@@ -144,19 +436,58 @@ class BaseTestCaseMeta(type):
         instance = super().__new__(mcs, name, bases, attrs)
         return cast("BaseTestCaseMeta", instance)
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        recorded = cls.__dict__.get(RECORDING)
+        if recorded is not None:
+            recorded[name] = value
+        elif name in cls.__dict__[CREATED_OBJECTS]:
+            cls.__dict__[DIRTY_OBJECTS].add(name)
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name in cls.__dict__[CREATED_OBJECTS]:
+            cls.__dict__[DIRTY_OBJECTS].add(name)
+        super().__delattr__(name)
+
 
 class BaseTestCase(TimeMixin, TestCase, metaclass=BaseTestCaseMeta):
     """ Base class for django tests."""
 
     @staticmethod
     def clone_object(obj: M, **kwargs: Any) -> M:
-        """ Clones a django model instance."""
-        obj = deepcopy(obj)
-        obj.pk = None
-        for k, v in kwargs.items():
-            setattr(obj, k, v)
-        obj.save(force_insert=True)
-        return obj
+        """
+        Clones a django model instance.
+
+        Field values from kwargs are passed to model constructor, other
+        attributes (i.e. properties) are set on a new instance before saving.
+        """
+        model = type(obj)
+        opts = model._meta
+        concrete_fields = opts.concrete_fields
+        fields = {
+            f.attname: getattr(obj, f.attname)
+            for f in concrete_fields
+            if not f.primary_key
+        }
+        attrs = {}
+        if kwargs:
+            # field values passed by name are set from kwargs, i.e.
+            # "project" overrides copied "project_id"
+            for f in concrete_fields:
+                if f.name in kwargs:
+                    fields.pop(f.attname, None)
+            for k, v in kwargs.items():
+                try:
+                    opts.get_field(k)
+                except FieldDoesNotExist:
+                    attrs[k] = v
+                else:
+                    fields[k] = v
+        new = model(**fields)
+        for k, v in attrs.items():
+            setattr(new, k, v)
+        new.save(force_insert=True, using=obj._state.db)
+        return new
 
     @classmethod
     def refresh_objects(cls) -> None:
@@ -165,37 +496,52 @@ class BaseTestCase(TimeMixin, TestCase, metaclass=BaseTestCaseMeta):
         class attributes.
         """
         cache = getattr(cls, CREATED_OBJECTS)
+        dirty = getattr(cls, DIRTY_OBJECTS)
         for k, v in cache.items():
-            setattr(cls, k, deepcopy(v))
+            if isinstance(v, (_Snapshot, _Pickled)):
+                v = v.restore()
+            elif type(v) in ATOMIC_TYPES:
+                # immutable values are shared with the template as is, and
+                # could only be changed by replacing class attribute.
+                if k not in dirty:
+                    continue
+            else:
+                v = deepcopy(v)
+            setattr(cls, k, v)
+        dirty.clear()
 
     @classmethod
     def forget_object(cls, obj: models.Model) -> None:
         """
         Method for removing django model instance from created objects cache
         """
-        key = None
-        for k, v in cls._created_objects.items():
-            if type(v) is type(obj) and v.pk == obj.pk:
-                key = k
-                break
-        if key is not None:
+        # primary key value is read from instance __dict__ bypassing Model.pk
+        # property and field descriptor.
+        pk = obj.__dict__.get(obj._meta.pk.attname)
+        index_key = (obj.__class__, pk)
+        keys = cls._created_index.get(index_key)
+        if keys:
+            # same instance may be saved as several class attributes, they
+            # are removed one by one in order of assignment.
+            key = keys.pop(0)
+            if not keys:
+                del cls._created_index[index_key]
             del cls._created_objects[key]
 
     @staticmethod
     def update_object(obj: models.Model, *args: Any, **kwargs: Any) -> None:
         """ Update django model object in database only."""
         args_iter = iter(args)
-        kwargs.update(dict(zip(args_iter, args_iter)))
-        # NOBUG mypy error "type[Model]" has no attribute "objects"
-        # ISSUE https://github.com/just-work/django-testing-utils/issues/67
-        obj._meta.model.objects.filter(pk=obj.pk).update(**kwargs)  # type: ignore[attr-defined]
+        # positional args are field name and value pairs
+        kwargs.update(zip(args_iter, args_iter))
+        # _base_manager does not filter rows like default manager could, so
+        # object is always found by pk, as in Model.save().
+        type(obj)._base_manager.filter(pk=obj.pk).update(**kwargs)
 
     @staticmethod
     def reload(obj: M) -> M:
         """ Fetch same object from database."""
-        # NOBUG mypy error "type[Model]" has no attribute "objects"
-        # ISSUE https://github.com/just-work/django-testing-utils/issues/67
-        return obj._meta.model.objects.get(pk=obj.pk)  # type: ignore[attr-defined]
+        return type(obj)._base_manager.get(pk=obj.pk)
 
     def setUp(self) -> None:
         self.refresh_objects()
@@ -204,6 +550,13 @@ class BaseTestCase(TimeMixin, TestCase, metaclass=BaseTestCaseMeta):
     def assert_object_fields(self, obj: models.Model, **kwargs: Any) -> None:
         """ Obtains an object from database and compares field values."""
         if obj.pk:
+            if all(_is_column(obj, k) for k in kwargs):
+                # fetch only compared columns without model instantiation
+                row = type(obj)._base_manager.filter(
+                    pk=obj.pk).values(*kwargs).get()
+                for k, v in kwargs.items():
+                    self.assertEqual(row[k], v, k)
+                return
             obj = self.reload(obj)
         for k, v in kwargs.items():
             value = getattr(obj, k)
@@ -1,47 +1,117 @@
 import functools
-from typing import Any, List, Union, Callable, Type
+import importlib
+import inspect
+import operator
+from typing import Any, List, Tuple, Union, Callable, Type, cast
 from unittest import mock, TestCase
-from types import TracebackType
-from django.test import utils
+from types import ModuleType, TracebackType
 
 # noinspection PyUnresolvedReferences,PyProtectedMember
 Patch = mock._patch
 
 
 # noinspection PyPep8Naming
-class override_defaults(utils.TestContextDecorator):
+class override_defaults:
     """
     A tool for convenient override default values in config files
 
     Act as either a decorator or a context manager. If it's a decorator, take a
-    function and return a wrapped function. If it's a contextmanager, use it
-    with the ``with`` statement. In either event, entering/exiting are called
-    before and after, respectively, the function/block is executed.
+    function or a TestCase subclass and return a wrapped one. If it's a
+    contextmanager, use it with the ``with`` statement. In either event,
+    entering/exiting are called before and after, respectively, the
+    function/block is executed.
     """
-    enable_exception = None
 
-    def __init__(self, app_name: str, **kwargs: Any):
+    def __init__(self, app_name: Union[str, ModuleType], **kwargs: Any):
         """ Save initial parameters.
 
-        :param app_name: the application name
+        :param app_name: the application name or module
         :param kwargs: default attributes and values to override
         """
+        if isinstance(app_name, ModuleType):
+            app_name = app_name.__name__
         self.app_name = app_name
         self.settings = kwargs
-        self.patchers: List[Patch] = []
-        super().__init__()
+        # defaults module is resolved once for all enable/disable calls
+        self.module = importlib.import_module(f'{app_name}.defaults')
+        self.names = tuple(kwargs)
+        self.values = tuple(kwargs.values())
+        # original values in same order as names
+        self.originals: List[Any] = []
 
     def enable(self) -> None:
-        """ Create patchers, start save and start them. """
-        for setting, value in self.settings.items():
-            patcher = mock.patch(f'{self.app_name}.defaults.{setting}', value)
-            self.patchers.append(patcher)
-            patcher.start()
+        """ Save original values and set overridden ones. """
+        module = self.module
+        # raises AttributeError for missing defaults before any changes
+        originals = [getattr(module, name) for name in self.names]
+        # originals are restored on exit even if nothing is changed here,
+        # so changes made inside a block are reverted too.
+        self.originals = originals
+        if all(o is v for o, v in zip(originals, self.values)):
+            # defaults already have same values
+            return
+        for name, value in zip(self.names, self.values):
+            setattr(module, name, value)
 
     def disable(self) -> None:
-        """ Stop patchers. """
-        for patcher in self.patchers:
-            patcher.stop()
+        """ Restore original values. """
+        module = self.module
+        for name, value in zip(self.names, self.originals):
+            setattr(module, name, value)
+        self.originals = []
+
+    def __enter__(self) -> None:
+        self.enable()
+
+    def __exit__(self,
+                 exc_type: Type[Exception],
+                 exc_val: Exception,
+                 exc_tb: TracebackType) -> None:
+        self.disable()
+
+    def __call__(self, decorated: Callable) -> Callable:
+        if isinstance(decorated, type):
+            return self.decorate_class(decorated)
+        return self.decorate_callable(decorated)
+
+    def decorate_class(self, cls: Type[TestCase]) -> Type[TestCase]:
+        """ Overrides defaults for each test of a TestCase subclass."""
+        if not issubclass(cls, TestCase):
+            raise TypeError('Can only decorate subclasses of unittest.TestCase')
+        decorated_set_up = cls.setUp
+
+        def setUp(testcase: TestCase) -> None:
+            self.enable()
+            testcase.addCleanup(self.disable)
+            decorated_set_up(testcase)
+
+        setattr(cls, 'setUp', setUp)
+        return cls
+
+    def decorate_callable(self, func: Callable) -> Callable:
+        """ Overrides defaults while a function is executed."""
+        if not self.names:
+            return func
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_inner(*args: Any, **kwargs: Any) -> Any:
+                self.enable()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.disable()
+
+            return async_inner
+
+        @functools.wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            self.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.disable()
+
+        return inner
 
 
 # noinspection PyPep8Naming
@@ -51,7 +121,7 @@ class disable_patchers:
     or passed by value to a decorator/context manager.
     """
     def __init__(self, *patchers: Union[str, Patch]) -> None:
-        self.patchers = patchers
+        self.patchers: Tuple[Union[str, Patch], ...] = patchers
 
     @staticmethod
     def get(obj: Any, name: Union[str, Patch]) -> Patch:
@@ -61,31 +131,52 @@ class disable_patchers:
             return getattr(obj, name)
         return name
 
+    @staticmethod
+    def stop(patchers: Tuple[Patch, ...]) -> None:
+        """ Stops patchers."""
+        for p in patchers:
+            p.stop()
+
+    @staticmethod
+    def start(patchers: Tuple[Patch, ...]) -> None:
+        """ Starts patchers in reverse order."""
+        for p in reversed(patchers):
+            p.start()
+
+    def resolver(self) -> Callable[[Any], Tuple[Patch, ...]]:
+        """ Returns a function that gets patcher instances from an object.
+        """
+        patchers = self.patchers
+        if not patchers or not all(isinstance(p, str) for p in patchers):
+            return lambda obj: tuple(self.get(obj, p) for p in patchers)
+        # all patchers are passed by name, fetching them in a single call
+        getter: Callable[[Any], Any] = operator.attrgetter(
+            *cast(Tuple[str, ...], patchers))
+        if len(patchers) == 1:
+            return lambda obj: (getter(obj),)
+        return getter
+
     def __call__(self, func: Callable) -> Callable:
+        # patcher names are resolved at decoration time
+        resolve = self.resolver()
 
         @functools.wraps(func)
         def inner(testcase: TestCase, *args: Any, **kwargs: Any) -> Any:
+            patchers = resolve(testcase)
+            self.stop(patchers)
             try:
-                for p in self.patchers:
-                    self.get(testcase, p).stop()
-
                 return func(testcase, *args, **kwargs)
-
             finally:
-                for p in self.patchers:
-                    self.get(testcase, p).start()
+                self.start(patchers)
 
         return inner
 
     def __enter__(self) -> None:
-        for p in self.patchers:
-            assert not isinstance(p, str)
-            p.stop()
+        assert not any(isinstance(p, str) for p in self.patchers)
+        self.stop(cast(Tuple[Patch, ...], self.patchers))
 
     def __exit__(self,
                  exc_type: Type[Exception],
                  exc_val: Exception,
                  exc_tb: TracebackType) -> None:
-        for p in self.patchers:
-            assert not isinstance(p, str)
-            p.start()
+        self.start(cast(Tuple[Patch, ...], self.patchers))
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-14 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='extra',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
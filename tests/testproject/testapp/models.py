@@ -24,3 +24,4 @@ class Task(models.Model):
     name = models.CharField(max_length=10, unique=True)
     attachment = models.FileField()
     visible = models.BooleanField(default=True)
+    extra = models.JSONField(default=dict, blank=True)
@@ -1,6 +1,7 @@
 import io
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models import Count
 from django.utils import timezone
 from django.utils.timezone import now as tested_now
 
@@ -8,8 +9,17 @@ from django_testing_utils import mixins
 from testproject.testapp import models
 
 
+class Helper:
+    """ Per-instance helper that keeps a reference to a model instance."""
+
+    def __init__(self, obj, callback=None):
+        self.obj = obj
+        self.callback = callback
+
+
 class MixinBaseTestCase(mixins.BaseTestCase):
     project: models.Project
+    task: models.Task
 
     @classmethod
     def setUpTestData(cls):
@@ -22,9 +32,13 @@ class MixinBaseTestCase(mixins.BaseTestCase):
                 name='filename.txt',
                 content=io.BytesIO().getvalue()
             ),
-            visible=False
+            visible=False,
+            extra={'key': ['value']},
         )
         cls.attr = 'a'
+        cls.items = ['a']
+        cls.callbacks = [lambda: 'a']
+        cls.querysets = {'projects': models.Project.objects.all()}
 
 
 class BaseTestCaseMetaTestCase(MixinBaseTestCase):
@@ -38,6 +52,12 @@ class BaseTestCaseMetaTestCase(MixinBaseTestCase):
         self.project.refresh_from_db()
         self.assertEqual(self.project.name, 'modified')
 
+    def test_update_object_args(self):
+        """ update_object accepts field names and values as positional args"""
+        self.update_object(self.task, 'name', 'modified', 'visible', True)
+
+        self.assert_object_fields(self.task, name='modified', visible=True)
+
     def test_clone_object(self):
         """ clones and returns a new object from db"""
         cloned_task = self.clone_object(self.task, name='unique name')
@@ -49,6 +69,22 @@ class BaseTestCaseMetaTestCase(MixinBaseTestCase):
         self.assertEqual(self.task.visible, cloned_task.visible)
         self.assertEqual(self.task.attachment, cloned_task.attachment)
 
+    def test_clone_object_related(self):
+        """ clone_object sets related object passed by field name."""
+        project = models.Project.objects.create(name='other')
+
+        cloned_task = self.clone_object(self.task, name='unique name',
+                                        project=project)
+
+        self.assert_object_fields(cloned_task, project_id=project.pk)
+
+    def test_clone_object_attributes(self):
+        """ clone_object sets attributes that are not model fields."""
+        cloned_task = self.clone_object(self.task, name='unique name',
+                                        custom_attr=5)
+
+        self.assertEqual(cloned_task.custom_attr, 5)  # type: ignore[attr-defined]
+
     def test_reload(self):
         """ reload fetches actual object version from db."""
         self.update_object(self.project, name='modified')
@@ -72,6 +108,13 @@ class BaseTestCaseMetaTestCase(MixinBaseTestCase):
 
         self.assert_object_fields(self.project, name='initial')
 
+    def test_assert_object_fields_related(self):
+        """ assert_object_fields compares related objects and files."""
+        self.assert_object_fields(self.task,
+                                  project=self.project,
+                                  project_id=self.project.pk,
+                                  attachment=self.task.attachment.name)
+
     def test_refresh_objects(self):
         """
         refresh_objects updates from db each django model instance created
@@ -79,11 +122,97 @@ class BaseTestCaseMetaTestCase(MixinBaseTestCase):
         """
         self.project.name = 'changed'
         self.__class__.attr = 'b'
+        self.items.append('b')
 
         self.refresh_objects()
 
         self.assertEqual(self.project.name, 'initial')
         self.assertEqual(self.__class__.attr, 'a')
+        self.assertEqual(self.items, ['a'])
+
+    def test_refresh_objects_mutable_field(self):
+        """ refresh_objects resets in-place changes of mutable field values."""
+        self.task.extra['key'].append('changed')
+
+        self.refresh_objects()
+
+        self.assertEqual(self.task.extra, {'key': ['value']})
+
+    def test_refresh_objects_unpicklable(self):
+        """ refresh_objects resets containers that could not be pickled."""
+        self.callbacks.append(lambda: 'b')
+
+        self.refresh_objects()
+
+        self.assertEqual([c() for c in self.callbacks], ['a'])
+
+    def test_refresh_objects_lazy_querysets(self):
+        """ refresh_objects does not evaluate querysets in containers."""
+        models.Project.objects.create(name='other')
+
+        self.refresh_objects()
+
+        self.assertEqual(len(self.querysets['projects']), 2)
+
+    def test_refresh_objects_deleted(self):
+        """ refresh_objects restores deleted class attributes."""
+        del self.__class__.attr
+
+        self.refresh_objects()
+
+        self.assertEqual(self.__class__.attr, 'a')
+
+    def test_refresh_objects_related(self):
+        """
+        refresh_objects resets in-memory changes of related objects.
+        """
+        self.task.project.name = 'changed'
+
+        self.refresh_objects()
+
+        self.assertEqual(self.task.project.name, 'initial')
+        self.assertEqual(self.project.name, 'initial')
+
+
+class ExtraAttributesTestCase(MixinBaseTestCase):
+    """
+    Checks resetting django model instance attributes that are not fields.
+    """
+    annotated: models.Project
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.annotated = models.Project.objects.annotate(
+            tasks_count=Count('task')).get(pk=cls.project.pk)
+        cls.task.tags = ['a']  # type: ignore[attr-defined]
+        cls.project.helper = Helper(cls.project)  # type: ignore[attr-defined]
+        # lambda could not be pickled
+        cls.annotated.helper = Helper(  # type: ignore[attr-defined]
+            cls.annotated, callback=lambda: 'a')
+
+    def test_refresh_objects_extra_attributes(self):
+        """
+        refresh_objects restores annotations and attributes set on instances.
+        """
+        self.annotated.tasks_count = 100
+        self.task.tags.append('b')  # type: ignore[attr-defined]
+
+        self.refresh_objects()
+
+        self.assertEqual(self.annotated.tasks_count, 1)
+        self.assertEqual(self.task.tags, ['a'])  # type: ignore[attr-defined]
+
+
+    def test_refresh_objects_back_references(self):
+        """
+        refresh_objects restores references to an instance from its attributes.
+        """
+        self.refresh_objects()
+
+        for obj in (self.project, self.annotated):
+            with self.subTest(obj=obj):
+                self.assertIs(obj.helper.obj, obj)  # type: ignore[attr-defined]
 
 
 class ForgetObjectTestCase(MixinBaseTestCase):
@@ -104,6 +233,29 @@ class ForgetObjectTestCase(MixinBaseTestCase):
         self.assertEqual(self.project.name, 'changed')
 
 
+class ForgetObjectAliasTestCase(MixinBaseTestCase):
+    """
+    Checks removing same instance saved as several class attributes
+    """
+    alias: models.Project
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.alias = cls.project
+
+    def test_forget_object_alias(self):
+        """
+        forget_object removes all class attributes for same instance one by one.
+        """
+        self.forget_object(self.alias)
+        self.assertNotIn('project', self._created_objects)
+        self.assertIn('alias', self._created_objects)
+
+        self.forget_object(self.alias)
+        self.assertNotIn('alias', self._created_objects)
+
+
 class SetUpTestDataResetTestCase(MixinBaseTestCase):
     """
     Ensures that objects created in setUpTestData are reset between tests
@@ -114,6 +266,8 @@ class SetUpTestDataResetTestCase(MixinBaseTestCase):
     def setUpTestData(cls) -> None:
         super().setUpTestData()
         cls.project2 = models.Project.objects.create(name='first')
+        # in-memory change after base class setUpTestData call
+        cls.task.visible = True
 
     def test_1_change_something(self):
         """
@@ -131,6 +285,7 @@ class SetUpTestDataResetTestCase(MixinBaseTestCase):
         """
         self.assertEqual(self.project.name, 'initial')
         self.assertEqual(self.project2.name, 'first')
+        self.assertTrue(self.task.visible)
 
 
 class TimeMixinTestCase(mixins.BaseTestCase):
@@ -140,3 +295,28 @@ class TimeMixinTestCase(mixins.BaseTestCase):
 
     def test_timezone_datetime_now(self):
         self.assertEqual(tested_now(), self.now)
+
+    def test_timezone_datetime_utcnow(self):
+        self.now += mixins.second
+        self.assertEqual(timezone.datetime.utcnow(), self.now)
+
+    def test_timezone_now_changed(self):
+        self.now += mixins.second
+        self.assertEqual(timezone.now(), self.now)
+        self.assertEqual(tested_now(), self.now)
+
+    def test_timezone_datetime_now_tz(self):
+        tz = timezone.get_fixed_timezone(180)
+        now = timezone.datetime.now(tz)
+        self.assertEqual(now, self.now)
+        self.assertEqual(now.utcoffset(), tz.utcoffset(now))
+
+    def test_1_timezone_now_side_effect(self):
+        """ Sets side effect for timezone.now mock."""
+        timezone.now.side_effect = [self.now]  # type: ignore[attr-defined]
+        self.assertEqual(timezone.now(), self.now)
+
+    def test_2_timezone_now_side_effect_reset(self):
+        """ Side effect from previous test is reset."""
+        self.assertEqual(timezone.now(), self.now)
+        self.assertEqual(timezone.now(), self.now)
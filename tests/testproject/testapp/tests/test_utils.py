@@ -1,39 +1,93 @@
+import operator
+
 from django.test import SimpleTestCase
 from django.utils import timezone
 
 from django_testing_utils.mixins import TimeMixin
 from django_testing_utils.utils import override_defaults, disable_patchers
+from testproject import testapp
 from testproject.testapp import defaults
 
 
 class OverrideDefaultsTests(SimpleTestCase):
     """ override_defaults test case. """
+    get_settings = staticmethod(operator.attrgetter('setting_1', 'setting_2'))
 
-    def test_original_value(self):
-        """ Check the original setting value. """
-        self.assertEqual('original1', defaults.setting_1)
-        self.assertEqual('original2', defaults.setting_2)
+    def test_all_modes(self):
+        """ Check the setting values overridden using the module name. """
+        with self.subTest(mode='original'):
+            self.assertEqual(('original1', 'original2'),
+                             self.get_settings(defaults))
+
+        with self.subTest(mode='context manager'):
+            with override_defaults('testproject.testapp',
+                                   setting_1='changed1',
+                                   setting_2='changed2'):
+                self.assertEqual(('changed1', 'changed2'),
+                                 self.get_settings(defaults))
+
+            self.assertEqual(('original1', 'original2'),
+                             self.get_settings(defaults))
+
+        with self.subTest(mode='decorator'):
+            @override_defaults('testproject.testapp',
+                               setting_1='changed1', setting_2='changed2')
+            def get_overridden():
+                return self.get_settings(defaults)
+
+            self.assertEqual(('changed1', 'changed2'), get_overridden())
+            self.assertEqual(('original1', 'original2'),
+                             self.get_settings(defaults))
+
+    def test_context_manager_using_module(self):
+        """ Check the setting value overridden using the module object. """
+        with override_defaults(testapp, setting_1='changed1'):
+            self.assertEqual('changed1', defaults.setting_1)
 
-    def test_context_manager_using_module_name(self):
-        """ Check the setting value overridden using the module name. """
         self.assertEqual('original1', defaults.setting_1)
-        self.assertEqual('original2', defaults.setting_2)
 
-        with override_defaults('testproject.testapp',
-                               setting_1='changed1',
-                               setting_2='changed2'):
+    def test_same_value(self):
+        """ Check overriding with the same value is no-op. """
+        with override_defaults('testproject.testapp', setting_1='changed1'):
+            with override_defaults('testproject.testapp',
+                                   setting_1='changed1'):
+                self.assertEqual('changed1', defaults.setting_1)
             self.assertEqual('changed1', defaults.setting_1)
-            self.assertEqual('changed2', defaults.setting_2)
 
         self.assertEqual('original1', defaults.setting_1)
-        self.assertEqual('original2', defaults.setting_2)
 
-    @override_defaults('testproject.testapp',
-                       setting_1='changed1', setting_2='changed2')
-    def test_decorator_using_module_name(self):
-        """ Check the setting value overridden using the module name. """
+    def test_same_value_restored(self):
+        """ Check changes inside no-op block are reverted on exit. """
+        with override_defaults('testproject.testapp', setting_1='original1'):
+            defaults.setting_1 = 'changed1'
+
+        self.assertEqual('original1', defaults.setting_1)
+
+    def test_reuse(self):
+        """ Check override_defaults instance could be entered repeatedly. """
+        overrider = override_defaults('testproject.testapp',
+                                      setting_1='changed1')
+        for _ in range(2):
+            with overrider:
+                self.assertEqual('changed1', defaults.setting_1)
+            self.assertEqual('original1', defaults.setting_1)
+
+
+@override_defaults('testproject.testapp', setting_1='changed1')
+class OverrideDefaultsClassTests(SimpleTestCase):
+    """ override_defaults as a TestCase class decorator. """
+    get_settings = staticmethod(operator.attrgetter('setting_1', 'setting_2'))
+
+    def test_class_decorator(self):
+        """ Check the setting value overridden for each test. """
         self.assertEqual('changed1', defaults.setting_1)
-        self.assertEqual('changed2', defaults.setting_2)
+        self.assertEqual('original2', defaults.setting_2)
+
+    @override_defaults('testproject.testapp', setting_2='changed2')
+    async def test_async_decorator(self):
+        """ Check the setting value overridden for async test. """
+        self.assertEqual(('changed1', 'changed2'),
+                         self.get_settings(defaults))
 
 
 class DisablePatchersTestCase(TimeMixin, SimpleTestCase):
@@ -41,7 +95,29 @@ class DisablePatchersTestCase(TimeMixin, SimpleTestCase):
     def test_disable_patcher_for_method(self):
         self.assertNotEqual(timezone.now(), timezone.now())
 
+    @disable_patchers('now_patcher')
+    def test_disable_single_patcher_for_method(self):
+        self.assertIsNot(timezone.now, self.now_mock)
+
     def test_disable_patcher_as_context_manager(self):
         self.assertEqual(timezone.now(), timezone.now())
         with disable_patchers(self.now_patcher, self.timezone_datetime_patcher):
             self.assertNotEqual(timezone.now(), timezone.now())
+        self.assertEqual(timezone.now(), self.now)
+
+    def test_patcher_1_stopped(self):
+        """
+        Stops patcher for test_patcher_2_restarted, that runs next due to
+        alphabetical ordering of test methods.
+        """
+        self.now_patcher.stop()
+
+    def test_patcher_2_restarted(self):
+        self.assertIs(timezone.now, self.now_mock)
+
+    def test_patcher_3_stopped(self):
+        """
+        Stops patcher in the last test of a test case, so tearDownClass must
+        not stop it again.
+        """
+        self.now_patcher.stop()